@@ -12,7 +12,10 @@ from pathlib import Path
 # Add parent directory to path to import from sync_notion_to_tokens
 sys.path.insert(0, str(Path(__file__).parent))
 
-from sync_notion_to_tokens import generate_neurai_display, ASSETS_IMAGES, ECOSYSTEM_ROOT
+from sync_notion_to_tokens import (
+    generate_neurai_display, display_frame, encode_bmp, load_font,
+    ASSETS_IMAGES, ECOSYSTEM_ROOT,
+)
 
 # placeholder.bmp is part of the minimal ESP32 bootstrap set (flashed to
 # the SD card alongside config.txt) so the device has something to show if
@@ -32,13 +35,14 @@ def main():
     # Generate with "placeholder" as RFID
     try:
         # Temporarily modify the function to save as placeholder.bmp
-        from PIL import Image, ImageDraw, ImageFont
+        from PIL import ImageDraw
 
         WIDTH = 240
         HEIGHT = 320
 
-        # Create image with black background
-        img = Image.new('RGB', (WIDTH, HEIGHT), color='#0a0a0a')
+        # Background, glow border, N logo, accent line and bottom branding:
+        # the same frame every token display starts from
+        img = display_frame().copy()
         draw = ImageDraw.Draw(img)
 
         # Dynamic font sizing based on text length
@@ -53,40 +57,8 @@ def main():
             font_size = 13
             line_height = 18
 
-        # Try to use monospace font, fall back to default if not available
-        try:
-            font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", font_size)
-            logo_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf", 8)  # Smaller logo
-            brand_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf", 12)  # Smaller branding
-        except:
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf", font_size)
-                logo_font = ImageFont.truetype("/usr/share/fonts/truetype/liberation/LiberationMono-Bold.ttf", 8)
-                brand_font = ImageFont.truetype("/usr/share/fonts/truetype/liberation/LiberationMono-Bold.ttf", 12)
-            except:
-                font = ImageFont.load_default()
-                logo_font = ImageFont.load_default()
-                brand_font = ImageFont.load_default()
-
-        # Add subtle red glow border
-        border_color = (204, 0, 0, 77)
-        draw.rectangle([1, 1, WIDTH - 2, HEIGHT - 2], outline=border_color, width=2)
-
-        # NeurAI ASCII Logo (top right corner, smaller)
-        logo = [
-            '███╗░░██╗',
-            '████╗░██║',
-            '██╔██╗██║',
-            '██║╚████║',
-            '██║░╚███║',
-            '╚═╝░░╚══╝'
-        ]
-        logo_color = (204, 0, 0, 102)
-        for i, line in enumerate(logo):
-            draw.text((WIDTH - 65, 10 + i * 7), line, fill=logo_color, font=logo_font)
-
-        # Red accent line below logo (higher up now)
-        draw.line([(10, 55), (WIDTH - 10, 55)], fill=(204, 0, 0), width=2)
+        # Monospace font (DejaVu, then Liberation, then Pillow's default)
+        font = load_font(font_size)
 
         # Text rendering with word wrap
         text_color = (255, 255, 255)
@@ -125,14 +97,6 @@ def main():
             y = start_y + (i * line_height)
             draw.text((padding, y), line, fill=text_color, font=font)
 
-        # Bottom NeurAI branding (smaller, tighter to bottom)
-        brand_color = (204, 0, 0, 153)
-        brand_text = 'N E U R A I'
-        bbox = draw.textbbox((0, 0), brand_text, font=brand_font)
-        brand_width = bbox[2] - bbox[0]
-        brand_x = (WIDTH - brand_width) / 2
-        draw.text((brand_x, HEIGHT - 16), brand_text, fill=brand_color, font=brand_font)
-
         # Scanline effect removed - was too prominent
 
         # Save to both PWA and ESP32-bootstrap locations. Placeholder is one
@@ -145,9 +109,12 @@ def main():
         pwa_path.parent.mkdir(parents=True, exist_ok=True)
         esp32_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save as 24-bit BMP
-        img.save(pwa_path, 'BMP')
-        img.save(esp32_path, 'BMP')
+        # Encode the 24-bit BMP once and write the same bytes to both places.
+        # (Not a hardlink: the two paths live in different submodule checkouts,
+        # and git would split them into separate files on the next checkout.)
+        bmp_bytes = encode_bmp(img)
+        pwa_path.write_bytes(bmp_bytes)
+        esp32_path.write_bytes(bmp_bytes)
 
         print(f"✓ Generated: {pwa_path}")
         print(f"✓ Generated: {esp32_path}")
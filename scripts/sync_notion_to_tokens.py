@@ -20,15 +20,21 @@ Flags:
   --prune    actually delete orphaned asset files (default: report only;
              skipped when token count shrinks >50% unless --force)
   --dry-run  fetch + validate only; write nothing, delete nothing
+  --jobs N   worker processes for display BMP rendering (default: CPU count)
+  --rerender regenerate every display BMP, even when its text is unchanged
 """
 
 import argparse
+import functools
+import hashlib
 import requests
 import json
 import os
 import re
+import struct
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
@@ -36,6 +42,15 @@ from PIL import Image, ImageDraw, ImageFont, ImageFilter
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 import generate_asset_manifest  # noqa: E402
 
+# Optional C-accelerated decoder for Notion responses (multi-page paginated
+# bodies) and the local JSON files read back each run; falls back to stdlib
+# json when orjson isn't installed. Writes stay on stdlib json.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Load environment variables from .env file if present
 try:
     from dotenv import load_dotenv
@@ -66,6 +81,9 @@ ASSETS_IMAGES = ASSETS_ROOT / "images"
 ASSETS_AUDIO = ASSETS_ROOT / "audio"
 VIDEOS_DIR = ECOSYSTEM_ROOT / "backend/public/videos"
 TOKENS_JSON = ECOSYSTEM_ROOT / "ALN-TokenData/tokens.json"
+TOKENS_SCHEMA_PATH = ECOSYSTEM_ROOT / "ALN-TokenData/tokens.schema.json"
+# Display-text hash of each BMP this machine last rendered (git-ignored).
+RENDER_CACHE_PATH = ECOSYSTEM_ROOT / "scripts/.render-cache.json"
 # NOTE: BMPs/WAVs are no longer copied into the ESP32 SD-card tree. The CYD
 # scanner now syncs them wirelessly from the backend at boot; the canonical
 # asset set lives only at ASSETS_ROOT. See CLAUDE.md "ESP32 Asset Sync
@@ -78,6 +96,21 @@ headers = {
     "Content-Type": "application/json"
 }
 
+def new_notion_session():
+    """A keep-alive session carrying the Notion headers.
+
+    Pagination is a run of back-to-back POSTs to the same host, so reusing
+    the pooled TCP/TLS connection saves a handshake per page. requests does
+    not document Session as thread-safe, so concurrent fetches each get
+    their own.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    return session
+
+# Default session for single-threaded callers of _notion_post.
+notion_session = new_notion_session()
+
 # Shared scoring config — source of truth for valid SF_MemoryType values.
 SCORING_CONFIG_PATH = ECOSYSTEM_ROOT / "ALN-TokenData/scoring-config.json"
 # Fallback when scoring-config.json is unavailable (matches docs/SCORING_LOGIC.md).
@@ -86,23 +119,35 @@ DEFAULT_VALID_MEMORY_TYPES = frozenset({"Personal", "Business", "Technical", "Me
 # Notion request hardening (F-TOOL-20)
 REQUEST_TIMEOUT = 30  # seconds per request
 MAX_RETRIES = 3       # retries on 429/5xx/network errors (4 attempts total)
+PAGE_SIZE = 100       # Notion's maximum; the default is also 100 but ask explicitly
+
+# Notion "Basic Type" select values that make an element a memory token.
+# Filtering happens server-side in fetch_all_memory_tokens.
+MEMORY_TOKEN_TYPES = (
+    "Memory Token",
+    "Memory Token Audio",
+    "Memory Token Video",
+    "Memory Token Audio + Image",
+)
 
 
 class NotionFetchError(Exception):
     """Raised when a Notion fetch cannot be verified complete (F-TOOL-01)."""
 
 
-def _notion_post(url, json_data):
+def _notion_post(url, json_data, session=None):
     """POST to the Notion API with timeout, and retry w/ backoff on 429/5xx.
 
     Honors Retry-After when present. Raises NotionFetchError on persistent
     failure or any non-retryable non-200 status (auth error, bad DB id, ...).
+    `session` defaults to the module-level notion_session.
     """
+    session = session or notion_session
     last_err = None
     for attempt in range(MAX_RETRIES + 1):
         retry_after = None
         try:
-            resp = requests.post(url, headers=headers, json=json_data, timeout=REQUEST_TIMEOUT)
+            resp = session.post(url, json=json_data, timeout=REQUEST_TIMEOUT)
         except requests.RequestException as e:
             last_err = f"network error: {e}"
         else:
@@ -113,8 +158,8 @@ def _notion_post(url, json_data):
                 raise NotionFetchError(f"HTTP {resp.status_code}: {resp.text[:300]}")
             else:
                 try:
-                    return resp.json()
-                except ValueError as e:
+                    return _json_loads(resp.content)
+                except ValueError as e:  # orjson.JSONDecodeError subclasses ValueError
                     raise NotionFetchError(f"invalid JSON response: {e}")
         if attempt < MAX_RETRIES:
             try:
@@ -135,6 +180,7 @@ def _query_database_all(database_id, base_query=None, post=None, force=False):
     """
     post = post or _notion_post
     query_data = dict(base_query or {})
+    query_data.setdefault("page_size", PAGE_SIZE)
     all_results = []
     has_more = True
     start_cursor = None
@@ -180,36 +226,103 @@ def join_rich_text(blocks, page_name="<unknown>"):
 WIDTH = 240
 HEIGHT = 320
 
+# Bump whenever generate_neurai_display's output changes for the same input,
+# so the render cache (RENDER_CACHE_PATH) stops treating old BMPs as fresh.
+RENDER_VERSION = 2
+
+# Translucent accents. The design (neurai-display-generator.jsx) draws them as
+# rgba(204, 0, 0, a) over the #0a0a0a background; displays are plain RGB, so
+# each is pre-blended against that background. (Passing the RGBA tuple to an
+# RGB draw silently dropped the alpha and drew them full red.)
+BACKGROUND_RGB = (10, 10, 10)  # #0a0a0a
+
+
+def _blend_over_background(rgb, alpha):
+    return tuple(round(bg + (c - bg) * alpha) for c, bg in zip(rgb, BACKGROUND_RGB))
+
+
+BORDER_COLOR = _blend_over_background((204, 0, 0), 0.3)
+LOGO_COLOR = _blend_over_background((204, 0, 0), 0.4)
+BRAND_COLOR = _blend_over_background((204, 0, 0), 0.6)
+TRUNCATE_COLOR = _blend_over_background((204, 0, 0), 0.8)
+
 # Font size configurations for measure-and-fit algorithm: (font_size, line_height)
 # Tries largest first, steps down until content fits
 FONT_SIZES = [(18, 24), (17, 23), (16, 21), (15, 20), (14, 19), (13, 18), (12, 16), (11, 15), (10, 14)]
 
 # Character name pattern: 2+ uppercase letters, optionally followed by 's or 's
 CHARACTER_NAME_PATTERN = re.compile(r"\b[A-Z]{2,}(?:'[sS])?\b")
-
-# Timestamp patterns - text format from Notion is: "TOKEN_CODE - TIMESTAMP - CONTENT"
-# We strip the token code first, then extract timestamp
+# Same pattern as one capture group, so re.split interleaves text and names.
+CHARACTER_NAME_SPLIT_PATTERN = re.compile(f"({CHARACTER_NAME_PATTERN.pattern})")
+
+# Timestamp pattern - text format from Notion is: "TOKEN_CODE - TIMESTAMP - CONTENT"
+# One anchored match strips the token code (if present) and extracts the
+# timestamp; time is tried before date (more specific). Without a timestamp
+# the match still ends after the token code, so only the code is stripped.
+# Token code: "TAC001 - " or "ALR001 - " etc.
 # Time: 1:22am, 11:32PM, 04:18PM, 03:52AM, ??:??AM (unknown), etc.
-TIME_PATTERN = re.compile(r'^((?:\d{1,2}|\?\?):(?:\d{2}|\?\?)\s*(?:am|pm|AM|PM)?)\s*[-–]?\s*')
 # Date: 05/12/2022, 03/20/2020, 11/10/20, ??/??/?? (unknown), etc.
-DATE_PATTERN = re.compile(r'^((?:\d{1,2}|\?\?)/(?:\d{1,2}|\?\?)/(?:\d{2,4}|\?\?))\s*[-–]?\s*')
-# Token code prefix pattern: "TAC001 - " or "ALR001 - " etc.
-TOKEN_PREFIX_PATTERN = re.compile(r'^[A-Za-z]{2,4}\d{2,4}\s*[-–]\s*', re.IGNORECASE)
+TIMESTAMP_PATTERN = re.compile(r'''
+    ^(?:[A-Za-z]{2,4}\d{2,4}\s*[-–]\s*)?
+    (?:
+        (?P<time>(?:\d{1,2}|\?\?):(?:\d{2}|\?\?)\s*(?:am|pm|AM|PM)?)\s*[-–]?\s*
+      | (?P<date>(?:\d{1,2}|\?\?)/(?:\d{1,2}|\?\?)/(?:\d{2,4}|\?\?))\s*[-–]?\s*
+    )?
+''', re.VERBOSE)
+
+# SF_ fields in the Description/Text block: SF_FieldName: [value] or
+# SF_FieldName: [ value ]. One alternation covers every field so a description
+# is scanned once; the lookahead keeps matches zero-width, so a field nested
+# inside another field's brackets is still found (same as a per-field search).
+SF_FIELD_PATTERN = re.compile(
+    r'(?=SF_(RFID|ValueRating|MemoryType|Group|Summary):\s*\[([^\]]*)\])',
+    re.IGNORECASE,
+)
+# Canonical key for each (case-insensitively matched) field name.
+SF_FIELD_KEYS = {
+    name.lower(): f"SF_{name}"
+    for name in ("RFID", "ValueRating", "MemoryType", "Group", "Summary")
+}
+# Values for fields absent from the description.
+SF_FIELD_DEFAULTS = {
+    'SF_RFID': None,
+    'SF_ValueRating': None,
+    'SF_MemoryType': None,
+    'SF_Group': "",
+    'SF_Summary': None,
+}
+
+
+# Monospace faces in preference order: (regular, bold)
+FONT_CANDIDATES = (
+    ("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+     "/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf"),
+    ("/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf",
+     "/usr/share/fonts/truetype/liberation/LiberationMono-Bold.ttf"),
+)
 
 
+@functools.lru_cache(maxsize=None)
+def _font_path(bold):
+    """First installed candidate font file for the weight, or None."""
+    for regular, bold_path in FONT_CANDIDATES:
+        path = bold_path if bold else regular
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=None)
 def load_font(size, bold=False):
-    """Load a font at the specified size."""
-    try:
-        if bold:
-            return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono-Bold.ttf", size)
-        return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf", size)
-    except:
-        try:
-            if bold:
-                return ImageFont.truetype("/usr/share/fonts/truetype/liberation/LiberationMono-Bold.ttf", size)
-            return ImageFont.truetype("/usr/share/fonts/truetype/liberation/LiberationMono-Regular.ttf", size)
-        except:
-            return ImageFont.load_default()
+    """Load a font at the specified size.
+
+    Cached: every display uses the same handful of (size, bold) pairs, so
+    each face is opened and parsed by FreeType once per process.
+    """
+    path = _font_path(bold)
+    if path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(path, size)
 
 
 def extract_timestamp(text):
@@ -227,32 +340,97 @@ def extract_timestamp(text):
                           'unknown' (??/?? format, dim), or None
         - remaining_text: Text with token code and timestamp stripped
     """
-    working_text = text
+    match = TIMESTAMP_PATTERN.match(text)
+    kind = 'time' if match.group('time') is not None else (
+        'date' if match.group('date') is not None else None)
+
+    if kind is None:
+        # No timestamp found, but still return text with token code stripped
+        return (None, None, text[match.end():])
+
+    ts = match.group(kind).strip()
+    # Check if it's unknown (contains ??)
+    ts_type = 'unknown' if '??' in ts else kind
+    return (ts, ts_type, text[match.end():].strip())
+
+
+# ImageFont.Layout arrived in Pillow 9.1; 9.0 only has the module constant.
+_LAYOUT_BASIC = ImageFont.Layout.BASIC if hasattr(ImageFont, "Layout") else ImageFont.LAYOUT_BASIC
+
+# Per-font glyph metrics for text_width(): font -> (advance, {char: (left, right)},
+# chars whose advance differs), or False when the font isn't eligible.
+_mono_metrics = {}
+
+def _monospace_metrics(font):
+    metrics = _mono_metrics.get(font)
+    if metrics is None:
+        # Only Pillow's basic layout places glyphs at plain integer advances;
+        # raqm shaping (and the bitmap default font) go through textbbox.
+        metrics = False
+        if isinstance(font, ImageFont.FreeTypeFont) and font.layout_engine == _LAYOUT_BASIC:
+            advance = font.getlength('M')
+            if advance.is_integer():
+                metrics = (int(advance), {}, set())
+        _mono_metrics[font] = metrics
+    return metrics
+
+def _glyph_metrics(text, font):
+    """(advance, {char: (left, right)}) covering every char of text, or None
+    when the font or any of the chars can't be measured arithmetically."""
+    metrics = _monospace_metrics(font)
+    if not metrics:
+        return None
+    advance, edges, irregular = metrics
+    chars = set(text)
+    for ch in chars - edges.keys() - irregular:
+        if font.getlength(ch) == advance:
+            bbox = font.getbbox(ch)
+            edges[ch] = (bbox[0], bbox[2])
+        else:
+            irregular.add(ch)
+    if not chars.isdisjoint(irregular):
+        return None
+    return advance, edges
 
-    # First, strip token code prefix if present (e.g., "TAC001 - ")
-    prefix_match = TOKEN_PREFIX_PATTERN.match(working_text)
-    if prefix_match:
-        working_text = working_text[prefix_match.end():]
+def text_width(text, font, draw):
+    """
+    Width of draw.textbbox((0, 0), text, font=font).
 
-    # Try time pattern first (more specific)
-    time_match = TIME_PATTERN.match(working_text)
-    if time_match:
-        ts = time_match.group(1).strip()
-        # Check if it's unknown (contains ??)
-        ts_type = 'unknown' if '??' in ts else 'time'
-        return (ts, ts_type, working_text[time_match.end():].strip())
+    For monospace fonts every glyph sits one advance after the previous
+    one, so the box spans from the first glyph's left edge to the last
+    glyph's right edge and the width is pure arithmetic over cached
+    per-character metrics. Anything else falls back to textbbox.
+    """
+    glyphs = _glyph_metrics(text, font) if text else None
+    if glyphs:
+        advance, edges = glyphs
+        return (len(text) - 1) * advance + edges[text[-1]][1] - edges[text[0]][0]
 
-    # Try date pattern
-    date_match = DATE_PATTERN.match(working_text)
-    if date_match:
-        ts = date_match.group(1).strip()
-        # Check if it's unknown (contains ??)
-        ts_type = 'unknown' if '??' in ts else 'date'
-        return (ts, ts_type, working_text[date_match.end():].strip())
+    bbox = draw.textbbox((0, 0), text, font=font)
+    return bbox[2] - bbox[0]
 
-    # No timestamp found, but still return text with token code stripped
-    return (None, None, working_text)
+def min_wrapped_lines(text, max_width, font):
+    """
+    Lower bound on len(wrap_text_with_font(text, max_width, font, draw)).
 
+    Lets measure-and-fit skip font sizes that cannot fit without wrapping.
+    A wrapped line either fits max_width or is a single overlong word, which
+    caps its length in characters; the normalized text has to be spread over
+    enough such lines. Returns 0 (no information) for non-monospace text.
+    """
+    words = text.split()
+    glyphs = _glyph_metrics("".join(words), font) if words else None
+    if not glyphs:
+        return 0
+    advance, edges = glyphs
+    chars = set("".join(words))
+    # A k-char line's width is (k - 1) * advance + right(last) - left(first);
+    # bound the edge term by the extremes over the chars present.
+    slack = max(edges[ch][0] for ch in chars) - min(edges[ch][1] for ch in chars)
+    max_chars = max((max_width + slack) // advance + 1, max(map(len, words)))
+    # Lines hold the n chars of the normalized text minus one space per break.
+    n = len(" ".join(words))
+    return -(-(n + 1) // (max_chars + 1))
 
 def wrap_text_with_font(text, max_width, font, draw):
     """
@@ -265,14 +443,33 @@ def wrap_text_with_font(text, max_width, font, draw):
     normalized_text = ' '.join(text.split())
     words = normalized_text.split(' ')
     lines = []
-    current_line = ''
 
+    glyphs = _glyph_metrics(normalized_text, font) if normalized_text else None
+    if glyphs:
+        # Monospace: a candidate line's width is arithmetic over its length
+        # and the edges of its first and last glyphs (see text_width), so
+        # lines are only built once they are complete.
+        advance, edges = glyphs
+        start = 0
+        length = len(words[0])
+        left = edges[words[0][0]][0]
+        for i in range(1, len(words)):
+            word = words[i]
+            test_length = length + 1 + len(word)
+            if (test_length - 1) * advance + edges[word[-1]][1] - left > max_width:
+                lines.append(' '.join(words[start:i]))
+                start = i
+                length = len(word)
+                left = edges[word[0]][0]
+            else:
+                length = test_length
+        lines.append(' '.join(words[start:]))
+        return lines
+
+    current_line = ''
     for word in words:
         test_line = current_line + (' ' if current_line else '') + word
-        bbox = draw.textbbox((0, 0), test_line, font=font)
-        text_width = bbox[2] - bbox[0]
-
-        if text_width > max_width and current_line:
+        if text_width(test_line, font, draw) > max_width and current_line:
             lines.append(current_line)
             current_line = word
         else:
@@ -291,20 +488,11 @@ def segment_line_for_highlighting(line):
     Returns:
         List of (text, is_character_name) tuples
     """
-    segments = []
-    last_end = 0
-
-    for match in CHARACTER_NAME_PATTERN.finditer(line):
-        # Add text before the match (if any)
-        if match.start() > last_end:
-            segments.append((line[last_end:match.start()], False))
-        # Add the character name
-        segments.append((match.group(), True))
-        last_end = match.end()
-
-    # Add remaining text after last match
-    if last_end < len(line):
-        segments.append((line[last_end:], False))
+    # re.split with one capture group alternates text, name, text, ...: odd
+    # indices are names. Empty pieces (a line starting or ending with a name,
+    # or two adjacent names) are dropped.
+    parts = CHARACTER_NAME_SPLIT_PATTERN.split(line)
+    segments = [(part, i % 2 == 1) for i, part in enumerate(parts) if part]
 
     # If no matches, return the whole line as non-highlighted
     if not segments:
@@ -313,6 +501,68 @@ def segment_line_for_highlighting(line):
     return segments
 
 
+def encode_bmp(img):
+    """
+    Encode an RGB image as a 24-bit bottom-up BMP.
+
+    Byte-identical to img.save(..., 'BMP') for an image without dpi info,
+    without going through Pillow's generic encoder: a fixed 54-byte header
+    followed by the pixel rows as BGR, last row first, padded to 4 bytes.
+    """
+    width, height = img.size
+    stride = (width * 3 + 3) & ~3
+    pixels = img.tobytes('raw', 'BGR', stride, -1)
+    file_header = struct.pack('<2sIHHI', b'BM', 54 + len(pixels), 0, 0, 54)
+    # BITMAPINFOHEADER: 24bpp, uncompressed, 3780 px/m (96 dpi, Pillow's default)
+    info_header = struct.pack(
+        '<IiiHHIIiiII', 40, width, height, 1, 24, 0, len(pixels), 3780, 3780, 0, 0
+    )
+    return file_header + info_header + pixels
+
+# NeurAI "N" logo, drawn in box-drawing glyphs in the top right corner
+NEURAI_LOGO = (
+    '███╗░░██╗',
+    '████╗░██║',
+    '██╔██╗██║',
+    '██║╚████║',
+    '██║░╚███║',
+    '╚═╝░░╚══╝',
+)
+
+
+@functools.lru_cache(maxsize=1)
+def display_frame():
+    """The token-independent parts of every display, drawn once per process.
+
+    Background, glow border, N logo, header accent line and bottom
+    branding. Callers draw on a .copy() instead of re-drawing these (six
+    logo text runs alone) for each token.
+    """
+    img = Image.new('RGB', (WIDTH, HEIGHT), color=BACKGROUND_RGB)
+    draw = ImageDraw.Draw(img)
+
+    # Add subtle red glow border
+    draw.rectangle([1, 1, WIDTH - 2, HEIGHT - 2], outline=BORDER_COLOR, width=2)
+
+    # === N LOGO (top right corner) ===
+    logo_font = load_font(8, bold=True)
+    for i, line in enumerate(NEURAI_LOGO):
+        draw.text((WIDTH - 65, 10 + i * 7), line, fill=LOGO_COLOR, font=logo_font)
+
+    # Red accent line below header
+    draw.line([(10, 55), (WIDTH - 10, 55)], fill=(204, 0, 0), width=2)
+
+    # === BOTTOM BRANDING ===
+    # Body text stops above the bottom reserve, and the truncation indicator
+    # sits left of the centered brand, so nothing drawn later overlaps it.
+    brand_font = load_font(12, bold=True)
+    brand_text = 'N E U R A I'
+    bbox = draw.textbbox((0, 0), brand_text, font=brand_font)
+    brand_width = bbox[2] - bbox[0]
+    brand_x = (WIDTH - brand_width) / 2
+    draw.text((brand_x, HEIGHT - 16), brand_text, fill=BRAND_COLOR, font=brand_font)
+    return img
+
 def generate_neurai_display(rfid, text):
     """
     Generate a NeurAI-styled 240x320 BMP display image.
@@ -329,13 +579,12 @@ def generate_neurai_display(rfid, text):
     Returns:
         The canonical PWA path (relative to ECOSYSTEM_ROOT) of the written BMP
     """
-    # Create image with black background
-    img = Image.new('RGB', (WIDTH, HEIGHT), color='#0a0a0a')
+    # Start from the static frame (background, border, logo, accent line,
+    # branding)
+    img = display_frame().copy()
     draw = ImageDraw.Draw(img)
 
-    # Load fixed fonts for header and branding
-    logo_font = load_font(8, bold=True)
-    brand_font = load_font(12, bold=True)
+    # Load fixed fonts for header
     header_code_font = load_font(14, bold=True)  # Token code font
     header_time_font = load_font(11, bold=False)  # Timestamp font
 
@@ -345,13 +594,6 @@ def generate_neurai_display(rfid, text):
     time_color = (255, 255, 255)  # Bright white for times (night-of)
     date_color = (180, 180, 180)  # Dimmer for dates (backstory)
     unknown_color = (140, 140, 140)  # Even dimmer for unknown timestamps (??/??/??)
-    logo_color = (204, 0, 0, 102)  # rgba(204, 0, 0, 0.4)
-    border_color = (204, 0, 0, 77)  # rgba(204, 0, 0, 0.3)
-    brand_color = (204, 0, 0, 153)  # rgba(204, 0, 0, 0.6)
-    truncate_color = (204, 0, 0, 204)  # rgba(204, 0, 0, 0.8)
-
-    # Add subtle red glow border
-    draw.rectangle([1, 1, WIDTH - 2, HEIGHT - 2], outline=border_color, width=2)
 
     # === HEADER ZONE (left of logo) ===
     # Available space: x=3 to x=170 (logo starts at x=175), y=3 to y=52 (accent line at y=55)
@@ -405,21 +647,6 @@ def generate_neurai_display(rfid, text):
         ts_y = header_y + code_height + header_gap
         draw.text((header_x, ts_y), timestamp, fill=ts_color, font=header_time_font)
 
-    # === N LOGO (top right corner) ===
-    logo = [
-        '███╗░░██╗',
-        '████╗░██║',
-        '██╔██╗██║',
-        '██║╚████║',
-        '██║░╚███║',
-        '╚═╝░░╚══╝'
-    ]
-    for i, line in enumerate(logo):
-        draw.text((WIDTH - 65, 10 + i * 7), line, fill=logo_color, font=logo_font)
-
-    # Red accent line below header
-    draw.line([(10, 55), (WIDTH - 10, 55)], fill=(204, 0, 0), width=2)
-
     # === BODY TEXT with measure-and-fit optimization ===
     padding = 15
     max_width = WIDTH - (padding * 2)
@@ -437,8 +664,10 @@ def generate_neurai_display(rfid, text):
 
     for font_size, line_height in FONT_SIZES:
         test_font = load_font(font_size)
-        lines = wrap_text_with_font(body_text, max_width, test_font, draw)
         max_lines = max_lines_for_height(line_height)
+        if min_wrapped_lines(body_text, max_width, test_font) > max_lines:
+            continue  # provably too long at this size; skip the wrap
+        lines = wrap_text_with_font(body_text, max_width, test_font, draw)
 
         if len(lines) <= max_lines:
             # This font size fits!
@@ -463,33 +692,30 @@ def generate_neurai_display(rfid, text):
         y = start_y + (i * selected_line_height)
         x = padding
 
-        # Segment line for character name highlighting
+        # Segment line for character name highlighting. Most lines have no
+        # names and are a single draw; only segments with something after
+        # them need measuring.
         segments = segment_line_for_highlighting(line)
+        last = len(segments) - 1
 
-        for segment_text, is_name in segments:
+        for j, (segment_text, is_name) in enumerate(segments):
             color = name_color if is_name else text_color
             draw.text((x, y), segment_text, fill=color, font=selected_font)
-            # Advance x position
-            bbox = draw.textbbox((0, 0), segment_text, font=selected_font)
-            x += bbox[2] - bbox[0]
+            if j < last:
+                # Advance x position
+                x += text_width(segment_text, selected_font, draw)
 
     # Add truncation indicator if text was cut off
     if needs_truncation:
         truncate_y = start_y + (len(display_lines) * selected_line_height) + 5
-        draw.text((padding, truncate_y), '[...]', fill=truncate_color, font=selected_font)
-
-    # === BOTTOM BRANDING ===
-    brand_text = 'N E U R A I'
-    bbox = draw.textbbox((0, 0), brand_text, font=brand_font)
-    brand_width = bbox[2] - bbox[0]
-    brand_x = (WIDTH - brand_width) / 2
-    draw.text((brand_x, HEIGHT - 16), brand_text, fill=brand_color, font=brand_font)
+        draw.text((padding, truncate_y), '[...]', fill=TRUNCATE_COLOR, font=selected_font)
 
     # Save to the single canonical PWA location; the ESP32 pulls this file
     # wirelessly from the backend at boot (see AssetService on device side).
+    # ASSETS_IMAGES itself is created once per batch by render_displays().
     pwa_path = ASSETS_IMAGES / f"{rfid}.bmp"
-    pwa_path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(pwa_path, 'BMP')
+    pwa_path.write_bytes(encode_bmp(img))
+    _record_asset(pwa_path)
     return str(pwa_path.relative_to(ECOSYSTEM_ROOT))
 
 def parse_sf_fields(description_text):
@@ -502,51 +728,109 @@ def parse_sf_fields(description_text):
     SF_MemoryType: [value]
     SF_Group: [value]
     SF_Summary: [value]
+
+    All fields are collected in one scan of the text; the first occurrence
+    of a field wins.
     """
-    sf_data = {}
-
-    # Pattern to match SF_FieldName: [value] or SF_FieldName: [ value ]
-    patterns = {
-        'SF_RFID': r'SF_RFID:\s*\[([^\]]*)\]',
-        'SF_ValueRating': r'SF_ValueRating:\s*\[([^\]]*)\]',
-        'SF_MemoryType': r'SF_MemoryType:\s*\[([^\]]*)\]',
-        'SF_Group': r'SF_Group:\s*\[([^\]]*)\]',
-        'SF_Summary': r'SF_Summary:\s*\[([^\]]*)\]',
-    }
+    sf_data = dict(SF_FIELD_DEFAULTS)
+
+    # The SF_ block usually trails a long narrative. Every match has '_' at
+    # offset 2, so no match can start before the first underscore minus 2:
+    # a C-level find skips the narrative instead of the regex trying (and
+    # failing) a match at every position in it.
+    underscore = description_text.find('_')
+    if underscore < 0:
+        return sf_data
+
+    # First pass only records each field's first raw value...
+    raw = {}
+    for match in SF_FIELD_PATTERN.finditer(description_text, max(underscore - 2, 0)):
+        field = SF_FIELD_KEYS[match.group(1).lower()]
+        if field not in raw:
+            raw[field] = match.group(2).strip()
+
+    # ...then each field is converted once; empty values keep the defaults.
+    rfid = raw.get('SF_RFID')
+    if rfid:
+        sf_data['SF_RFID'] = rfid.lower()
+    rating = raw.get('SF_ValueRating')
+    if rating:
+        try:
+            sf_data['SF_ValueRating'] = int(rating)
+        except ValueError:
+            pass
+    # Small closed vocabularies repeated across every token: intern so all
+    # tokens share one string object per distinct value.
+    memory_type = raw.get('SF_MemoryType')
+    if memory_type:
+        sf_data['SF_MemoryType'] = sys.intern(memory_type)
+    group = raw.get('SF_Group')
+    if group:
+        sf_data['SF_Group'] = sys.intern(group)
+    summary = raw.get('SF_Summary')
+    if summary:
+        sf_data['SF_Summary'] = summary
 
-    for field, pattern in patterns.items():
-        match = re.search(pattern, description_text, re.IGNORECASE)
-        if match:
-            value = match.group(1).strip()
+    return sf_data
 
-            # Convert to appropriate type
-            if field == 'SF_RFID':
-                sf_data[field] = value.lower() if value else None
-            elif field == 'SF_ValueRating':
-                try:
-                    sf_data[field] = int(value) if value else None
-                except ValueError:
-                    sf_data[field] = None
-            elif field == 'SF_MemoryType':
-                sf_data[field] = value if value else None
-            elif field == 'SF_Group':
-                sf_data[field] = value if value else ""
-            elif field == 'SF_Summary':
-                sf_data[field] = value if value else None
-        else:
-            # Set defaults
-            if field == 'SF_RFID':
-                sf_data[field] = None
-            elif field == 'SF_ValueRating':
-                sf_data[field] = None
-            elif field == 'SF_MemoryType':
-                sf_data[field] = None
-            elif field == 'SF_Group':
-                sf_data[field] = ""
-            elif field == 'SF_Summary':
-                sf_data[field] = None
+def extract_display_text(description):
+    """Return the display text: everything BEFORE the first SF_ field marker.
 
-    return sf_data
+    The slice is stripped; a description with no marker (or one starting
+    with it) is returned unchanged.
+    """
+    sf_start = description.find('SF_')
+    if sf_start > 0:
+        return description[:sf_start].strip()
+    return description
+
+# Directory listings for asset lookup, built once per directory per run.
+# Each maps lowercased file stem -> [filenames], so resolving a token's
+# assets is a dict lookup instead of a stat per extension plus a full
+# directory scan for the case-insensitive fallback.
+_asset_listings = {}
+
+def _asset_listing(directory):
+    """Return the cached {stem.lower(): [filenames]} listing for directory."""
+    listing = _asset_listings.get(directory)
+    if listing is None:
+        listing = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    stem = os.path.splitext(entry.name)[0].lower()
+                    listing.setdefault(stem, []).append(entry.name)
+        except FileNotFoundError:
+            pass
+        _asset_listings[directory] = listing
+    return listing
+
+def _record_asset(path):
+    """Add a file written during this run to its directory's cached listing."""
+    listing = _asset_listings.get(path.parent)
+    if listing is not None:
+        names = listing.setdefault(path.stem.lower(), [])
+        if path.name not in names:
+            names.append(path.name)
+
+def _match_asset(rfid, directory, extensions):
+    """Return the filename in directory for rfid with one of extensions, or None."""
+    names = _asset_listing(directory).get(rfid.lower())
+    if not names:
+        return None
+
+    # Try exact case match
+    for ext in extensions:
+        if f"{rfid}{ext}" in names:
+            return f"{rfid}{ext}"
+
+    # Try case-insensitive match
+    exts = {ext.lower() for ext in extensions}
+    for name in names:
+        if os.path.splitext(name)[1].lower() in exts:
+            return name
+
+    return None
 
 def find_asset_file(rfid, directory, extensions):
     """
@@ -556,25 +840,13 @@ def find_asset_file(rfid, directory, extensions):
     if not rfid:
         return None
 
-    for ext in extensions:
-        # Try exact case match
-        file_path = directory / f"{rfid}{ext}"
-        if file_path.exists():
-            # Return relative path from aln-memory-scanner
-            if "images" in str(directory):
-                return f"assets/images/{rfid}{ext}"
-            elif "audio" in str(directory):
-                return f"assets/audio/{rfid}{ext}"
-
-    # Try case-insensitive match
-    if directory.exists():
-        for file in directory.iterdir():
-            if file.stem.lower() == rfid.lower() and file.suffix.lower() in [ext.lower() for ext in extensions]:
-                # Return relative path
-                if "images" in str(directory):
-                    return f"assets/images/{file.name}"
-                elif "audio" in str(directory):
-                    return f"assets/audio/{file.name}"
+    name = _match_asset(rfid, directory, extensions)
+    if name:
+        # Return relative path from aln-memory-scanner
+        if "images" in str(directory):
+            return f"assets/images/{name}"
+        elif "audio" in str(directory):
+            return f"assets/audio/{name}"
 
     return None
 
@@ -586,18 +858,7 @@ def find_video_file(rfid):
     if not rfid:
         return None
 
-    # Try exact case match
-    video_path = VIDEOS_DIR / f"{rfid}.mp4"
-    if video_path.exists():
-        return f"{rfid}.mp4"
-
-    # Try case-insensitive match
-    if VIDEOS_DIR.exists():
-        for file in VIDEOS_DIR.iterdir():
-            if file.stem.lower() == rfid.lower() and file.suffix.lower() == ".mp4":
-                return file.name
-
-    return None
+    return _match_asset(rfid, VIDEOS_DIR, [".mp4"])
 
 def fetch_all_characters(force=False, post=None):
     """Fetch all characters from Notion and build {page_id: name} map.
@@ -630,10 +891,8 @@ def fetch_all_memory_tokens(force=False, post=None):
     query_data = {
         "filter": {
             "or": [
-                {"property": "Basic Type", "select": {"equals": "Memory Token"}},
-                {"property": "Basic Type", "select": {"equals": "Memory Token Audio"}},
-                {"property": "Basic Type", "select": {"equals": "Memory Token Video"}},
-                {"property": "Basic Type", "select": {"equals": "Memory Token Audio + Image"}}
+                {"property": "Basic Type", "select": {"equals": basic_type}}
+                for basic_type in MEMORY_TOKEN_TYPES
             ]
         }
     }
@@ -644,16 +903,12 @@ def page_title(page):
     name_data = page.get("properties", {}).get("Name", {}).get("title", [])
     return join_rich_text(name_data, "<title>") or "Untitled"
 
-def process_token(page, character_map, dry_run=False):
-    """Process a single Notion page into a token entry."""
-    props = page["properties"]
-
-    # Get Name
-    name = page_title(page)
+def parse_token_page(page, name):
+    """Parse a Notion page into (rfid, sf_data, display_text).
 
-    # Get Basic Type
-    basic_type_data = props.get("Basic Type", {}).get("select")
-    basic_type = basic_type_data["name"] if basic_type_data else None
+    Returns None (after logging) when the page has no SF_RFID.
+    """
+    props = page["properties"]
 
     # Get Description/Text (tolerates mention/equation blocks — F-TOOL-18)
     desc_data = props.get("Description/Text", {}).get("rich_text", [])
@@ -662,33 +917,18 @@ def process_token(page, character_map, dry_run=False):
     # Parse SF_ fields
     sf_data = parse_sf_fields(description)
 
-    # Extract only the text BEFORE SF_ fields for display
-    display_text = description
-    if description:
-        # Find the first SF_ field marker
-        sf_start = description.find('SF_')
-        if sf_start > 0:
-            # Get only text before SF_ fields, strip whitespace
-            display_text = description[:sf_start].strip()
-
-    if not sf_data.get('SF_RFID'):
+    # Fail fast: without an RFID the page can't become a token, so skip it
+    # before any display-text, BMP or filesystem work is done.
+    rfid = sf_data['SF_RFID']
+    if not rfid:
         print(f"⚠️  Skipping {name}: No SF_RFID found in description")
         return None
 
-    rfid = sf_data['SF_RFID']
+    return rfid, sf_data, extract_display_text(description)
 
-    # Generate NeurAI display BMP if display text exists
-    generated_bmp = False
-    if display_text and display_text.strip():
-        if dry_run:
-            print(f"   [dry-run] would generate NeurAI display for {rfid}")
-        else:
-            try:
-                generate_neurai_display(rfid, display_text)
-                print(f"   Generated NeurAI display for {rfid}")
-                generated_bmp = True
-            except Exception as e:
-                print(f"⚠️  Failed to generate NeurAI display for {rfid}: {e}")
+def build_token_entry(page, rfid, sf_data, character_map, generated_bmp=False):
+    """Build the tokens.json entry for a parsed page from the assets on disk."""
+    props = page["properties"]
 
     # Find assets
     image_file = find_asset_file(rfid, ASSETS_IMAGES, ['.bmp', '.jpg', '.png', '.jpeg'])
@@ -697,8 +937,7 @@ def process_token(page, character_map, dry_run=False):
 
     # Use placeholder if no image found and no BMP was generated
     if not image_file and not generated_bmp:
-        placeholder_path = ASSETS_IMAGES / "placeholder.bmp"
-        if placeholder_path.exists():
+        if "placeholder.bmp" in _asset_listing(ASSETS_IMAGES).get("placeholder", ()):
             image_file = "assets/images/placeholder.bmp"
 
     # Build token entry
@@ -708,13 +947,13 @@ def process_token(page, character_map, dry_run=False):
         "video": video_file,
         "processingImage": None,  # Default to None
         "SF_RFID": rfid,
-        "SF_ValueRating": sf_data.get('SF_ValueRating'),
-        "SF_MemoryType": sf_data.get('SF_MemoryType'),
-        "SF_Group": sf_data.get('SF_Group', "")
+        "SF_ValueRating": sf_data['SF_ValueRating'],
+        "SF_MemoryType": sf_data['SF_MemoryType'],
+        "SF_Group": sf_data['SF_Group']
     }
 
     # Look up character owner from Notion relation
-    owner_refs = page["properties"].get("Owner", {}).get("relation", [])
+    owner_refs = props.get("Owner", {}).get("relation", [])
     if owner_refs:
         owner_id = owner_refs[0]["id"]  # First owner (primary)
         token_entry["owner"] = character_map.get(owner_id)
@@ -722,15 +961,84 @@ def process_token(page, character_map, dry_run=False):
         token_entry["owner"] = None
 
     # Add summary field if it exists (optional field)
-    if sf_data.get('SF_Summary'):
-        token_entry["summary"] = sf_data.get('SF_Summary')
+    summary = sf_data['SF_Summary']
+    if summary:
+        token_entry["summary"] = summary
 
     # Set processingImage only if video exists
     if video_file and image_file:
         token_entry["processingImage"] = image_file
         token_entry["image"] = None  # Video tokens don't have image, only processingImage
 
-    return rfid, token_entry
+    return token_entry
+
+def display_hash(rfid, text):
+    """Fingerprint of everything a rendered display depends on."""
+    key = f"{RENDER_VERSION}\0{rfid}\0{text}".encode()
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+def load_render_cache(path=None):
+    """Load {rfid: display_hash} for BMPs rendered by a previous run.
+
+    A missing or unreadable cache just means everything re-renders.
+    """
+    path = Path(path or RENDER_CACHE_PATH)
+    try:
+        cache = _json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_render_cache(cache, path=None):
+    path = Path(path or RENDER_CACHE_PATH)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Machine-only file: compact separators, no pretty-printing.
+        with path.open("w") as f:
+            json.dump(cache, f, separators=(",", ":"), sort_keys=True)
+    except OSError as e:
+        print(f"⚠️  Could not save render cache {path}: {e}")
+
+def _render_display_job(job):
+    """Process-pool worker: render one display BMP. Returns (rfid, error)."""
+    rfid, text = job
+    try:
+        generate_neurai_display(rfid, text)
+    except Exception as e:
+        return rfid, str(e)
+    return rfid, None
+
+def render_displays(jobs, max_workers=None):
+    """Render NeurAI display BMPs for {rfid: display_text}.
+
+    Rendering is CPU-bound and independent per token, so it is spread over
+    a process pool. Returns the set of RFIDs whose BMP was generated.
+    """
+    items = list(jobs.items())
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(items))
+    if items:
+        ASSETS_IMAGES.mkdir(parents=True, exist_ok=True)
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_render_display_job, items, chunksize=8))
+    else:
+        results = [_render_display_job(item) for item in items]
+
+    generated = set()
+    for rfid, error in results:
+        if error is None:
+            print(f"   Generated NeurAI display for {rfid}")
+            generated.add(rfid)
+            # Written by a worker process, so this process's cached listing
+            # has not seen it yet.
+            bmp_path = ASSETS_IMAGES / f"{rfid}.bmp"
+            if bmp_path.is_file():
+                _record_asset(bmp_path)
+        else:
+            print(f"⚠️  Failed to generate NeurAI display for {rfid}: {error}")
+    return generated
 
 def load_valid_memory_types(path=None):
     """Load valid SF_MemoryType values from scoring-config.json typeMultipliers.
@@ -784,9 +1092,7 @@ def validate_against_schema(tokens, schema_path=None):
     (backend/tests/contract/token-data/tokens-schema.test.js) is the
     always-on enforcement gate for the same schema.
     """
-    schema_path = schema_path if schema_path is not None else (
-        ECOSYSTEM_ROOT / "ALN-TokenData/tokens.schema.json"
-    )
+    schema_path = schema_path if schema_path is not None else TOKENS_SCHEMA_PATH
     try:
         import jsonschema
     except ImportError:
@@ -881,6 +1187,13 @@ def parse_args(argv=None):
     parser.add_argument(
         "--dry-run", action="store_true",
         help="fetch + validate only: no tokens.json write, no BMP generation, no prune, no manifest")
+    parser.add_argument(
+        "--jobs", type=int, default=None, metavar="N",
+        help="worker processes for NeurAI display BMP rendering "
+             "(default: CPU count; 1 renders in-process)")
+    parser.add_argument(
+        "--rerender", action="store_true",
+        help="regenerate every NeurAI display BMP, ignoring the render cache")
     return parser.parse_args(argv)
 
 
@@ -894,6 +1207,9 @@ def main(argv=None):
     print("=" * 60)
     print()
 
+    # Asset directories may have changed since a previous in-process run.
+    _asset_listings.clear()
+
     # Verify directories exist. sd-card-deploy is no longer a write target
     # (images/audio now sync wirelessly to the ESP32 from these canonical
     # locations).
@@ -912,14 +1228,25 @@ def main(argv=None):
     # Fetch from Notion. ANY incomplete fetch aborts before a single byte is
     # written or deleted (E8 failure posture). --force overrides.
     try:
-        print("Fetching memory tokens from Notion...")
-        pages = fetch_all_memory_tokens(force=args.force)
+        print("Fetching memory tokens and characters from Notion...")
+        # The two databases are independent and the fetch is network-bound,
+        # so overlap them instead of paying both round-trip chains in turn.
+        # Each thread paginates on its own session.
+        with new_notion_session() as tokens_session, \
+                new_notion_session() as characters_session, \
+                ThreadPoolExecutor(max_workers=2) as pool:
+            pages_future = pool.submit(
+                fetch_all_memory_tokens, force=args.force,
+                post=functools.partial(_notion_post, session=tokens_session),
+            )
+            characters_future = pool.submit(
+                fetch_all_characters, force=args.force,
+                post=functools.partial(_notion_post, session=characters_session),
+            )
+            pages = pages_future.result()
+            character_map = characters_future.result()
         print(f"Found {len(pages)} memory token elements in Notion")
         print()
-
-        print("Fetching characters from Notion...")
-        character_map = fetch_all_characters(force=args.force)
-        print()
     except NotionFetchError as e:
         print()
         print(f"✗ ABORTING: Notion fetch incomplete: {e}")
@@ -939,36 +1266,69 @@ def main(argv=None):
     duplicate_warnings = []
 
     print("Processing tokens...")
+    parsed = []
     for page in pages:
-        result = process_token(page, character_map, dry_run=args.dry_run)
         name = page_title(page)
+        result = parse_token_page(page, name)
         if result:
-            rfid, token_entry = result
-            if rfid in rfid_sources:
-                duplicate_warnings.append(
-                    f"duplicate SF_RFID '{rfid}' on pages '{rfid_sources[rfid]}' and '{name}' "
-                    f"— last processed wins, the other page's data is DISCARDED"
-                )
-            else:
-                rfid_sources[rfid] = name
-            tokens[rfid] = token_entry
-
-            # Log what was found (show actual filenames)
-            assets = []
-            if token_entry["image"]:
-                assets.append(token_entry["image"])
-            if token_entry["audio"]:
-                assets.append(token_entry["audio"])
-            if token_entry["video"]:
-                assets.append(token_entry["video"])
-            if token_entry["processingImage"]:
-                assets.append(f"processingImage: {token_entry['processingImage']}")
-
-            assets_str = ", ".join(assets) if assets else "no assets"
-            print(f"✓ {rfid}: {name} ({assets_str})")
+            parsed.append((page, name, result))
         else:
             skipped.append(name)
 
+    # Render display BMPs up front, in parallel. A duplicate RFID keeps the
+    # last page's text, matching which BMP survived the old serial loop.
+    render_jobs = {
+        rfid: display_text
+        for _, _, (rfid, _, display_text) in parsed
+        if display_text.strip()
+    }
+    if args.dry_run:
+        for rfid in render_jobs:
+            print(f"   [dry-run] would generate NeurAI display for {rfid}")
+        generated = set()
+    else:
+        # Skip tokens whose display text is unchanged since the last run and
+        # whose BMP is still on disk.
+        render_cache = {} if args.rerender else load_render_cache()
+        hashes = {rfid: display_hash(rfid, text) for rfid, text in render_jobs.items()}
+        images = _asset_listing(ASSETS_IMAGES)
+        unchanged = {
+            rfid for rfid, digest in hashes.items()
+            if render_cache.get(rfid) == digest and f"{rfid}.bmp" in images.get(rfid, ())
+        }
+        stale = {rfid: text for rfid, text in render_jobs.items() if rfid not in unchanged}
+        if unchanged:
+            print(f"   {len(unchanged)} NeurAI display(s) unchanged since last render")
+        generated = unchanged | render_displays(stale, args.jobs)
+        save_render_cache({rfid: hashes[rfid] for rfid in generated})
+
+    for page, name, (rfid, sf_data, _) in parsed:
+        token_entry = build_token_entry(
+            page, rfid, sf_data, character_map, generated_bmp=rfid in generated
+        )
+        if rfid in rfid_sources:
+            duplicate_warnings.append(
+                f"duplicate SF_RFID '{rfid}' on pages '{rfid_sources[rfid]}' and '{name}' "
+                f"— last processed wins, the other page's data is DISCARDED"
+            )
+        else:
+            rfid_sources[rfid] = name
+        tokens[rfid] = token_entry
+
+        # Log what was found (show actual filenames)
+        assets = []
+        if token_entry["image"]:
+            assets.append(token_entry["image"])
+        if token_entry["audio"]:
+            assets.append(token_entry["audio"])
+        if token_entry["video"]:
+            assets.append(token_entry["video"])
+        if token_entry["processingImage"]:
+            assets.append(f"processingImage: {token_entry['processingImage']}")
+
+        assets_str = ", ".join(assets) if assets else "no assets"
+        print(f"✓ {rfid}: {name} ({assets_str})")
+
     print()
     print(f"Processed {len(tokens)} tokens")
     if skipped:
@@ -1005,8 +1365,7 @@ def main(argv=None):
     suspicious_shrink = False
     existing_count = 0
     if TOKENS_JSON.exists():
-        with open(TOKENS_JSON) as f:
-            existing_count = len(json.load(f))
+        existing_count = len(_json_loads(TOKENS_JSON.read_bytes()))
         if len(sorted_tokens) < existing_count * 0.5:
             suspicious_shrink = True
             print(f"⚠️  WARNING: Only {len(sorted_tokens)} tokens found (existing file has {existing_count}). Possible Notion data problem.")
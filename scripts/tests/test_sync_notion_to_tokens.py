@@ -5,10 +5,19 @@ quirks from the 2026-06 platform review (F-TOOL-17, F-TOOL-08). Quirk pins
 are explicitly marked "documented-bug pin" — when those findings are fixed,
 flip the assertions deliberately as part of the fix commit.
 """
+import io
+
+from PIL import Image, ImageDraw
+
 from sync_notion_to_tokens import (
+    encode_bmp,
     extract_timestamp,
+    load_font,
+    min_wrapped_lines,
     parse_sf_fields,
     segment_line_for_highlighting,
+    text_width,
+    wrap_text_with_font,
 )
 
 
@@ -120,7 +129,7 @@ class TestExtractTimestamp:
         assert rest == "Plain text without any structure"
 
     def test_five_letter_token_code_is_not_stripped(self):
-        # documented-bug pin (F-TOOL-17): TOKEN_PREFIX_PATTERN only matches
+        # documented-bug pin (F-TOOL-17): the token-code prefix only matches
         # 2-4 letters + 2-4 digits, so a 5-letter code leaks into the
         # rendered BMP body text (and blocks timestamp extraction, since
         # the timestamp is no longer at string start). Flip when fixed.
@@ -163,6 +172,80 @@ class TestSegmentLineForHighlighting:
         assert segments == [("nothing shouted here", False)]
 
 
+class TestTextWidth:
+    SAMPLES = [
+        "x", "ALEX met MORGAN", " leading and trailing ", "10:30pm – “quoted” …",
+        "café █╗░ mixed", "i" * 40, "WWWWWWWWWW",
+    ]
+
+    def test_matches_textbbox(self):
+        draw = ImageDraw.Draw(Image.new("RGB", (10, 10)))
+        for size in (10, 14, 18):
+            for bold in (False, True):
+                font = load_font(size, bold)
+                for text in self.SAMPLES:
+                    bbox = draw.textbbox((0, 0), text, font=font)
+                    assert text_width(text, font, draw) == bbox[2] - bbox[0], (size, bold, text)
+
+
+class TestWrapTextWithFont:
+    @staticmethod
+    def reference_wrap(text, max_width, font, draw):
+        # Greedy wrap measuring every candidate line with textbbox
+        lines, current = [], ""
+        for word in text.split():
+            test = f"{current} {word}" if current else word
+            bbox = draw.textbbox((0, 0), test, font=font)
+            if bbox[2] - bbox[0] > max_width and current:
+                lines.append(current)
+                current = word
+            else:
+                current = test
+        return lines + [current] if current else lines
+
+    def test_matches_textbbox_wrap(self):
+        draw = ImageDraw.Draw(Image.new("RGB", (10, 10)))
+        texts = [
+            "", "short", "ALEX met MORGAN at the gala.  \n" * 20,
+            "W" * 60 + " tiny " + "W" * 60, "10:30pm – “quoted” … café " * 15,
+        ]
+        for size in (10, 14, 18):
+            font = load_font(size)
+            for max_width in (210, 40):
+                for text in texts:
+                    assert wrap_text_with_font(text, max_width, font, draw) == \
+                        self.reference_wrap(text, max_width, font, draw), (size, max_width, text)
+
+
+class TestMinWrappedLines:
+    def test_never_exceeds_actual_wrap(self):
+        draw = ImageDraw.Draw(Image.new("RGB", (10, 10)))
+        texts = [
+            "", "short", "ALEX met MORGAN at the gala. " * 20,
+            "W" * 60 + " tiny " + "W" * 60, "10:30pm – “quoted” … café " * 15,
+        ]
+        for size in (10, 14, 18):
+            font = load_font(size)
+            for max_width in (210, 40):
+                for text in texts:
+                    actual = len(wrap_text_with_font(text, max_width, font, draw))
+                    assert min_wrapped_lines(text, max_width, font) <= actual
+
+    def test_long_text_bound_is_useful(self):
+        text = "word " * 200
+        assert min_wrapped_lines(text, 210, load_font(18)) > 10
+
+
+class TestEncodeBmp:
+    def test_byte_identical_to_pillow(self):
+        # Odd width exercises the 4-byte row padding; 240 is the real size.
+        for size in ((240, 320), (7, 5)):
+            img = Image.effect_noise(size, 64).convert("RGB")
+            buf = io.BytesIO()
+            img.save(buf, "BMP")
+            assert encode_bmp(img) == buf.getvalue()
+
+
 class TestValidateAgainstSchema:
     """Phase 2: JSON Schema validation (soft dependency on jsonschema)."""
 
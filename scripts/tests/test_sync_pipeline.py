@@ -77,6 +77,27 @@ class TestQueryDatabaseAll:
         ])
         assert sync._query_database_all("db-id", post=post) == [1, 2, 3]
 
+    def test_requests_max_page_size(self):
+        sent = []
+
+        def post(url, json_data):
+            sent.append(dict(json_data))
+            return {"results": [], "has_more": False}
+
+        sync._query_database_all("db-id", base_query={"filter": {}}, post=post)
+        assert sent == [{"filter": {}, "page_size": sync.PAGE_SIZE}]
+
+    def test_memory_token_filter_covers_every_type(self):
+        sent = []
+
+        def post(url, json_data):
+            sent.append(json_data)
+            return {"results": [], "has_more": False}
+
+        sync.fetch_all_memory_tokens(post=post)
+        types = [c["select"]["equals"] for c in sent[0]["filter"]["or"]]
+        assert types == list(sync.MEMORY_TOKEN_TYPES)
+
     def test_force_returns_partial_on_failure(self, capsys):
         post = fake_post_pages([
             {"results": [1, 2], "has_more": True, "next_cursor": "c1"},
@@ -186,6 +207,70 @@ class TestJoinRichText:
         assert "Page X" in out and "mention" in out
 
 
+# ── Asset lookup (cached directory listing) ────────────────────────────
+
+
+class TestFindAssetFile:
+    @pytest.fixture(autouse=True)
+    def fresh_listings(self):
+        sync._asset_listings.clear()
+        yield
+        sync._asset_listings.clear()
+
+    def test_exact_match_preferred_in_extension_order(self, tmp_path):
+        images = tmp_path / "images"
+        images.mkdir()
+        (images / "tok001.png").write_bytes(b"x")
+        (images / "tok001.bmp").write_bytes(b"x")
+        assert sync.find_asset_file("tok001", images, [".bmp", ".png"]) == "assets/images/tok001.bmp"
+
+    def test_case_insensitive_fallback(self, tmp_path):
+        audio = tmp_path / "audio"
+        audio.mkdir()
+        (audio / "TOK001.MP3").write_bytes(b"x")
+        assert sync.find_asset_file("tok001", audio, [".mp3"]) == "assets/audio/TOK001.MP3"
+        assert sync.find_asset_file("tok002", audio, [".mp3"]) is None
+
+    def test_missing_directory_finds_nothing(self, tmp_path):
+        assert sync.find_asset_file("tok001", tmp_path / "images", [".bmp"]) is None
+
+    def test_file_written_after_listing_is_found(self, tmp_path):
+        images = tmp_path / "images"
+        images.mkdir()
+        assert sync.find_asset_file("tok001", images, [".bmp"]) is None
+        path = images / "tok001.bmp"
+        path.write_bytes(b"x")
+        sync._record_asset(path)
+        assert sync.find_asset_file("tok001", images, [".bmp"]) == "assets/images/tok001.bmp"
+
+
+# ── Display rendering phase ────────────────────────────────────────────
+
+
+class TestRenderDisplays:
+    def test_failures_reported_and_excluded(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setattr(sync, "ASSETS_IMAGES", tmp_path)
+
+        def fake_generate(rfid, text):
+            if rfid == "bad001":
+                raise OSError("disk full")
+            (tmp_path / f"{rfid}.bmp").write_bytes(b"x")
+
+        monkeypatch.setattr(sync, "generate_neurai_display", fake_generate)
+        generated = sync.render_displays({"tok001": "hi", "bad001": "hi"}, max_workers=1)
+        assert generated == {"tok001"}
+        assert "disk full" in capsys.readouterr().out
+
+    def test_creates_missing_images_dir(self, tmp_path, monkeypatch):
+        images = tmp_path / "assets" / "images"
+        monkeypatch.setattr(sync, "ASSETS_IMAGES", images)
+        monkeypatch.setattr(
+            sync, "generate_neurai_display",
+            lambda rfid, text: (images / f"{rfid}.bmp").write_bytes(b"x"),
+        )
+        assert sync.render_displays({"tok001": "hi"}, max_workers=1) == {"tok001"}
+
+
 # ── Atomic write (F-TOOL-10) ───────────────────────────────────────────
 
 
@@ -226,11 +311,13 @@ def sandbox(tmp_path, monkeypatch):
     monkeypatch.setattr(sync, "ASSETS_AUDIO", audio)
     monkeypatch.setattr(sync, "VIDEOS_DIR", videos)
     monkeypatch.setattr(sync, "TOKENS_JSON", tokens_json)
+    monkeypatch.setattr(sync, "TOKENS_SCHEMA_PATH", tmp_path / "tokens.schema.json")
+    monkeypatch.setattr(sync, "RENDER_CACHE_PATH", tmp_path / "render-cache.json")
     monkeypatch.setattr(
         sync, "generate_neurai_display",
         lambda rfid, text: f"assets/images/{rfid}.bmp",
     )
-    return {"tokens_json": tokens_json, "images": images, "audio": audio}
+    return {"tokens_json": tokens_json, "images": images, "audio": audio, "videos": videos}
 
 
 class TestMainAbortPosture:
@@ -242,6 +329,9 @@ class TestMainAbortPosture:
             raise sync.NotionFetchError("HTTP 500 mid-pagination")
 
         monkeypatch.setattr(sync, "fetch_all_memory_tokens", boom)
+        # Both databases are fetched concurrently; stub the sibling so the
+        # test stays offline.
+        monkeypatch.setattr(sync, "fetch_all_characters", lambda force=False, post=None: {})
         with pytest.raises(SystemExit) as exc:
             sync.main([])
         assert exc.value.code == 1
@@ -271,6 +361,23 @@ class TestMainAbortPosture:
         out = capsys.readouterr().out
         assert "WARNING" in out and "owner" in out.lower()
 
+    def test_concurrent_fetches_use_separate_sessions(self, sandbox, monkeypatch):
+        sessions = {}
+
+        def fetch_tokens(force=False, post=None):
+            sessions["tokens"] = post.keywords["session"]
+            return []
+
+        def fetch_characters(force=False, post=None):
+            sessions["characters"] = post.keywords["session"]
+            return {"c": "X"}
+
+        monkeypatch.setattr(sync, "fetch_all_memory_tokens", fetch_tokens)
+        monkeypatch.setattr(sync, "fetch_all_characters", fetch_characters)
+        sync.main(["--dry-run"])
+        assert sessions["tokens"] is not sessions["characters"]
+        assert sync.notion_session not in sessions.values()
+
 
 class TestMainPruneGating:
     def _wire(self, monkeypatch, pages):
@@ -351,3 +458,79 @@ class TestMainPruneGating:
         out = capsys.readouterr().out
         assert "First Page" in out and "Second Page" in out
         assert "duplicate" in out.lower()
+
+
+# ── Token entry assets ─────────────────────────────────────────────────
+
+
+class TestTokenEntryAssets:
+    def _sync_one(self, sandbox, monkeypatch):
+        page = make_page("Token A", "SF_RFID: [tok001]\nSF_ValueRating: [3]")
+        monkeypatch.setattr(sync, "fetch_all_memory_tokens", lambda force=False, post=None: [page])
+        monkeypatch.setattr(sync, "fetch_all_characters", lambda force=False, post=None: {"c": "X"})
+        sync.main([])
+        return json.loads(sandbox["tokens_json"].read_text())["tok001"]
+
+    def test_placeholder_used_when_token_has_no_image(self, sandbox, monkeypatch):
+        (sandbox["images"] / "placeholder.bmp").write_bytes(b"x")
+
+        def failed_render(rfid, text):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(sync, "generate_neurai_display", failed_render)
+        token = self._sync_one(sandbox, monkeypatch)
+        assert token["image"] == "assets/images/placeholder.bmp"
+
+    def test_video_token_moves_image_to_processing_image(self, sandbox, monkeypatch):
+        (sandbox["images"] / "tok001.png").write_bytes(b"x")
+        (sandbox["videos"] / "tok001.mp4").write_bytes(b"x")
+        token = self._sync_one(sandbox, monkeypatch)
+        assert token["video"] == "tok001.mp4"
+        assert token["processingImage"] == "assets/images/tok001.png"
+        assert token["image"] is None
+
+
+# ── Render cache (skip unchanged display BMPs) ─────────────────────────
+
+
+class TestRenderCache:
+    def _wire(self, sandbox, monkeypatch, description):
+        page = make_page("Token A", description + "\n\nSF_RFID: [tok001]\nSF_ValueRating: [3]")
+        monkeypatch.setattr(sync, "fetch_all_memory_tokens", lambda force=False, post=None: [page])
+        monkeypatch.setattr(sync, "fetch_all_characters", lambda force=False, post=None: {"c": "X"})
+        rendered = []
+
+        def fake_generate(rfid, text):
+            rendered.append(rfid)
+            (sandbox["images"] / f"{rfid}.bmp").write_bytes(b"x")
+
+        monkeypatch.setattr(sync, "generate_neurai_display", fake_generate)
+        return rendered
+
+    def test_unchanged_text_is_not_rerendered(self, sandbox, monkeypatch):
+        rendered = self._wire(sandbox, monkeypatch, "Body")
+        sync.main(["--jobs", "1"])
+        sync.main(["--jobs", "1"])
+        assert rendered == ["tok001"]
+        tokens = json.loads(sandbox["tokens_json"].read_text())
+        assert tokens["tok001"]["image"] == "assets/images/tok001.bmp"
+
+    def test_changed_text_rerenders(self, sandbox, monkeypatch):
+        rendered = self._wire(sandbox, monkeypatch, "Body")
+        sync.main(["--jobs", "1"])
+        rendered = self._wire(sandbox, monkeypatch, "New body")
+        sync.main(["--jobs", "1"])
+        assert rendered == ["tok001"]
+
+    def test_missing_bmp_rerenders(self, sandbox, monkeypatch):
+        rendered = self._wire(sandbox, monkeypatch, "Body")
+        sync.main(["--jobs", "1"])
+        (sandbox["images"] / "tok001.bmp").unlink()
+        sync.main(["--jobs", "1"])
+        assert rendered == ["tok001", "tok001"]
+
+    def test_rerender_ignores_cache(self, sandbox, monkeypatch):
+        rendered = self._wire(sandbox, monkeypatch, "Body")
+        sync.main(["--jobs", "1"])
+        sync.main(["--jobs", "1", "--rerender"])
+        assert rendered == ["tok001", "tok001"]